@@ -1,21 +1,219 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
+import functools
+import json
+import string
+import threading
+import time
 import unicodedata
+from collections.abc import Callable
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated
 from typing import Any
 from typing import ClassVar
 
 import httpx
-from pydantic import BaseModel
-from pydantic import Extra
-from pydantic import Field
-from pydantic import validator
+from pydantic import ValidationInfo
+from pydantic.config import ConfigDict
+from pydantic.fields import Field
+from pydantic.functional_validators import AfterValidator
+from pydantic.functional_validators import field_validator
+from pydantic.main import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 API_BASE_URL = "https://statsapi.web.nhl.com"
 
+# A single shared client so that repeated requests can re-use pooled
+# keep-alive connections instead of doing a new TLS handshake every time.
+_CLIENT = httpx.Client(
+    base_url=API_BASE_URL,
+    timeout=10.0,
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=10),
+)
+atexit.register(_CLIENT.close)
+# Used for sending a few requests concurrently on _CLIENT (see _get_many)
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="hockey_api")
+
+# How long (in seconds) responses from the API are re-used before they are
+# requested again, and how many responses are kept at most. Note that the
+# franchises, conferences and divisions looked up by id (Franchise.by_id
+# etc.) are kept for the lifetime of the process regardless, use
+# clear_cache() to get rid of them.
+CACHE_TTL = 300.0
+CACHE_MAXSIZE = 256
+# ordered from the oldest entry to the newest
+_response_cache: dict[tuple, tuple[float, bytes]] = {}
+# _get may be called from several threads at once
+_cache_lock = threading.Lock()
+
+
+def _cache_key(path: str, params: dict[str, Any] | None) -> tuple:
+    """
+    Hashable key for a request. httpx also accepts lists (and tuples) of
+    values for query parameters, those are turned into tuples.
+
+    Examples:
+    ========
+    >>> _cache_key("/api/v1/teams", {"teamId": [22, 1], "expand": "team.stats"})
+    ('/api/v1/teams', (('expand', 'team.stats'), ('teamId', (22, 1))))
+    """
+    return (path, tuple(
+        (name, tuple(value) if isinstance(value, (list, tuple)) else value)
+        for name, value in sorted((params or {}).items())
+    ))
+
+
+def _cache_lookup(key: tuple) -> bytes | None:
+    with _cache_lock:
+        cached = _response_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < CACHE_TTL:
+        return cached[1]
+    return None
+
+
+def _cache_response(key: tuple, resp: httpx.Response) -> bytes:
+    """
+    Cache and return the body of a successful response. Raises
+    NotFoundException for 404 responses and httpx.HTTPStatusError for other
+    error responses.
+    """
+    if resp.status_code == 404:
+        raise NotFoundException(f"Nothing found at {resp.url}")
+    resp.raise_for_status()
+    now = time.monotonic()
+    with _cache_lock:
+        # re-inserting moves the key to the end, keeping the order
+        _response_cache.pop(key, None)
+        _response_cache[key] = (now, resp.content)
+        _evict(now)
+    return resp.content
+
+
+def _evict(now: float) -> None:
+    while _response_cache:
+        oldest_key, (fetched_at, _) = next(iter(_response_cache.items()))
+        if len(_response_cache) <= CACHE_MAXSIZE and now - fetched_at < CACHE_TTL:
+            break
+        del _response_cache[oldest_key]
+
+
+def _get(path: str, params: dict[str, Any] | None = None) -> bytes:
+    """
+    Send a GET request to the API and return the body of the response.
+    Responses are cached for CACHE_TTL seconds. Raises NotFoundException if
+    the API responds with 404 and httpx.HTTPStatusError for other errors.
+    """
+    key = _cache_key(path, params)
+    content = _cache_lookup(key)
+    if content is None:
+        content = _cache_response(key, _CLIENT.get(path, params=params))
+    return content
+
+
+def _get_many(requests: Sequence[tuple[str, dict[str, Any] | None]]) -> list[bytes]:
+    """
+    Like _get but for several (path, params) pairs, the requests are sent
+    concurrently. Returns the bodies in the same order.
+    """
+    if len(requests) <= 1:
+        return [_get(path, params) for path, params in requests]
+    return list(_EXECUTOR.map(lambda request: _get(*request), requests))
+
+
+# orjson is optional, it's only used for parsing responses into plain dicts
+_loads: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
+
+
+def get_json(path: str, params: dict[str, Any] | None = None) -> Any:
+    """
+    Get the parsed JSON response from any end point of the API. Useful for
+    debugging and for end points that have no models yet.
+
+    Examples:
+    ========
+    standings = get_json("/api/v1/standings", params={"season": 20112012})
+    """
+    return _loads(_get(path, params))
+
+
+def _async_client() -> httpx.AsyncClient:
+    # An AsyncClient is tied to the event loop it is used in, so unlike
+    # _CLIENT it can't be shared and a new one is created when needed.
+    return httpx.AsyncClient(base_url=API_BASE_URL, timeout=10.0, http2=True)
+
+
+async def _aget(
+    client: httpx.AsyncClient,
+    path: str,
+    params: dict[str, Any] | None = None,
+) -> bytes:
+    """
+    Async version of _get, shares the same response cache.
+    """
+    key = _cache_key(path, params)
+    content = _cache_lookup(key)
+    if content is None:
+        content = _cache_response(key, await client.get(path, params=params))
+    return content
+
+
+def _expand_params(expands: Sequence[str]) -> dict[str, str]:
+    """
+    Query parameters for the given expands. The API expects them as a single
+    comma-separated value, sorting them keeps the urls (and cache keys)
+    consistent regardless of the order they were given in. A single string
+    is treated as a (comma-separated) expand rather than a sequence of
+    characters.
+
+    Examples:
+    ========
+    >>> _expand_params(["team.stats", "team.roster"])
+    {'expand': 'team.roster,team.stats'}
+    >>> _expand_params("team.stats")
+    {'expand': 'team.stats'}
+    >>> _expand_params(())
+    {}
+    """
+    if isinstance(expands, str):
+        expands = expands.split(",")
+    return {"expand": ",".join(sorted(expands))} if expands else {}
+
 
+# For ASCII strings lowercasing the bytes with a translation table is much
+# faster than str.casefold (which gives the same result for them).
+_ASCII_LOWER = bytes.maketrans(
+    string.ascii_uppercase.encode("ASCII"),
+    string.ascii_lowercase.encode("ASCII"),
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def clean_str(s: str) -> bytes:
-    normalized_str = unicodedata.normalize("NFKD", s).casefold()
-    return normalized_str.encode("ASCII", "ignore")
+    """
+    Normalize a string for comparisons: accents and other diacritics are
+    removed and the result is casefolded and encoded as ASCII.
+
+    Examples:
+    ========
+    >>> clean_str('Montréal')
+    b'montreal'
+    >>> clean_str('Œrsted')
+    b'oersted'
+    """
+    if s.isascii():
+        return s.encode("ASCII").translate(_ASCII_LOWER)
+    folded = unicodedata.normalize("NFKD", s).casefold()
+    # ligatures do not decompose in NFKD
+    folded = folded.replace("æ", "ae").replace("œ", "oe")
+    return folded.encode("ASCII", "ignore")
 
 
 def string_equal(orig: str, search: str) -> bool:
@@ -52,23 +250,54 @@ def none_if_link_null(value: Any) -> Any:
     return value
 
 
+def prepend_base_url(link: str) -> str:
+    """
+    Turns links relative to the API root (as given in API responses) into
+    absolute urls.
+
+    Examples:
+    ========
+    >>> prepend_base_url('/api/v1/teams/22')
+    'https://statsapi.web.nhl.com/api/v1/teams/22'
+    """
+    if link.startswith("/"):
+        return API_BASE_URL+link
+    return link
+
+
+ApiLink = Annotated[str, AfterValidator(prepend_base_url)]
+
+
 class NotFoundException(Exception):
     pass
 
 
-class Conference(BaseModel, extra=Extra.forbid):
+def cached_if_found(value: Any, cache: dict[int, Any]) -> Any:
+    """
+    Replaces a dict with an "id" (as found nested in API responses) with the
+    object cached under that id, if there is one. Used for validators so that
+    parsed objects can share the same instances. Never makes any requests.
+    """
+    if isinstance(value, dict) and "id" in value:
+        return cache.get(value["id"], value)
+    return value
+
+
+class Conference(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     id: int
     name: str
-    link: str
-    abbreviation: str | None
+    link: ApiLink
+    abbreviation: str | None = None
     short_name: str | None = Field(None, alias="shortName")
-    active: bool | None
+    active: bool | None = None
 
-    possible_expands: ClassVar[list[str]] = []
+    possible_expands: ClassVar[tuple[str, ...]] = ()
 
-    @validator("link")
-    def prepend_base_url(cls, link: str) -> str:
-        return API_BASE_URL+link
+    _fetched: ClassVar[bool] = False
+    _active: ClassVar[list[Conference]] = []
+    conferences_by_id: ClassVar[dict[int, Conference]] = {}
 
     def __str__(self):
         return self.name
@@ -77,36 +306,63 @@ class Conference(BaseModel, extra=Extra.forbid):
     def all(cls) -> list[Conference]:
         """
         Get a list of all currently active conferences in the league.
+        Because the conferences rarely change, the results are cached
+        (until clear_cache is called) and the same objects are returned
+        every time.
 
         Examples:
         ========
         conferences = Conference.all()
         """
-        resp = httpx.get(f"{API_BASE_URL}/api/v1/conferences")
-        resp_dict = resp.json()
-        return [cls.parse_obj(obj) for obj in resp_dict["conferences"]]
+        if not cls._fetched:
+            cls._load(_get("/api/v1/conferences"))
+        return list(cls._active)
+
+    @classmethod
+    def _load(cls, content: bytes) -> None:
+        """
+        Parse a response from the /conferences end point and cache the results.
+        """
+        if cls._fetched:
+            return
+        conferences = _ConferencesResponse.model_validate_json(content).conferences
+        Conference._active = [
+            cls.conferences_by_id.setdefault(conference.id, conference)
+            for conference in conferences
+        ]
+        Conference._fetched = True
 
     @classmethod
     def by_id(cls, id: int) -> Conference:
         """
-        Find a conference by its id, raises an exception if not found
+        Find a conference by its id, raises an exception if not found.
+        The currently active conferences are fetched (and cached) all at once,
+        inactive ones are requested individually.
 
         Examples:
         ========
         cmbl = Conference.by_id(6)
         """
-        resp = httpx.get(
-            f"{API_BASE_URL}/api/v1/conferences",
+        if not cls._fetched:
+            cls.all()
+        if id in cls.conferences_by_id:
+            return cls.conferences_by_id[id]
+        content = _get(
+            "/api/v1/conferences",
             params={"conferenceId": id}
         )
-        conferences = resp.json()["conferences"]
+        conferences = _ConferencesResponse.model_validate_json(content).conferences
         if conferences == []:
             raise NotFoundException(f"No conference with {id=}")
-        conference_obj, = conferences
-        return cls.parse_obj(conference_obj)
+        conference, = conferences
+        return cls.conferences_by_id.setdefault(id, conference)
+
+
+class _ConferencesResponse(BaseModel):
+    conferences: list[Conference]
 
 
-class Division(BaseModel, extra=Extra.forbid):
+class Division(BaseModel):
     """
     Class representing a division in the National Hockey League.
     For most (but not all) of the NHL history the teams playing in the league have been
@@ -119,61 +375,96 @@ class Division(BaseModel, extra=Extra.forbid):
     https://statsapi.web.nhl.com/api/v1/divisions/15
     https://statsapi.web.nhl.com/api/v1/divisions?divisionId=1,2,3&expand=division.conference
     """
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     id: int
     name: str
-    link: str
-    abbreviation: str | None
+    link: ApiLink
+    abbreviation: str | None = None
     short_name: str | None = Field(None, alias="nameShort")
-    conference: Conference | None
-    active: bool | None
+    conference: Conference | None = None
+    active: bool | None = None
 
-    possible_expands: ClassVar[list[str]] = [
+    possible_expands: ClassVar[tuple[str, ...]] = (
         # Adds conference.{abbreviation,shortName,active}
         "division.conference",
-    ]
+    )
 
-    @validator("link")
-    def prepend_base_url(cls, v: str) -> str:
-        return API_BASE_URL+v
+    _fetched: ClassVar[bool] = False
+    _active: ClassVar[list[Division]] = []
+    divisions_by_id: ClassVar[dict[int, Division]] = {}
 
-    @validator("conference", pre=True)
+    @field_validator("conference", mode="before")
+    @classmethod
     def discard_null_conference(cls, value: Any) -> Any:
         return none_if_link_null(value)
 
     @classmethod
-    def all(cls, expands: list[str] = []) -> list[Division]:
+    def all(cls, expands: Sequence[str] = ()) -> list[Division]:
         """
         Get a list of all currently active divisions in the league.
+        Without expands the results are cached (until clear_cache is called)
+        and the same objects are returned every time.
 
         Examples:
         ========
         divisions = Division.all(expands=["division.conference"])
         """
-        resp = httpx.get(f"{API_BASE_URL}/api/v1/divisions")
-        resp_dict = resp.json()
-        return [cls.parse_obj(obj) for obj in resp_dict["divisions"]]
+        if expands:
+            content = _get("/api/v1/divisions", params=_expand_params(expands))
+            return _DivisionsResponse.model_validate_json(content).divisions
+        if not cls._fetched:
+            cls._load(_get("/api/v1/divisions"))
+        return list(cls._active)
 
     @classmethod
-    def by_id(cls, id: int, expands: list[str] = []) -> Division:
+    def _load(cls, content: bytes) -> None:
+        """
+        Parse a response from the /divisions end point and cache the results.
         """
-        Find a division by its id, raises an exception if not found
+        if cls._fetched:
+            return
+        divisions = _DivisionsResponse.model_validate_json(content).divisions
+        Division._active = [
+            cls.divisions_by_id.setdefault(division.id, division)
+            for division in divisions
+        ]
+        Division._fetched = True
+
+    @classmethod
+    def by_id(cls, id: int, expands: Sequence[str] = ()) -> Division:
+        """
+        Find a division by its id, raises an exception if not found.
+        Without expands the currently active divisions are fetched (and cached)
+        all at once, inactive ones are requested individually.
 
         Examples:
         ========
         pacific = Division.by_id(15)
         """
-        resp = httpx.get(
-            f"{API_BASE_URL}/api/v1/divisions",
-            params={"divisionId": id, "expand": expands}
+        if not expands:
+            if not cls._fetched:
+                cls.all()
+            if id in cls.divisions_by_id:
+                return cls.divisions_by_id[id]
+        content = _get(
+            "/api/v1/divisions",
+            params={"divisionId": id, **_expand_params(expands)}
         )
-        divisions = resp.json()["divisions"]
+        divisions = _DivisionsResponse.model_validate_json(content).divisions
         if divisions == []:
             raise NotFoundException(f"No division with {id=}")
-        division_obj, = divisions
-        return cls.parse_obj(division_obj)
+        division, = divisions
+        if expands:
+            return division
+        return cls.divisions_by_id.setdefault(id, division)
+
 
+class _DivisionsResponse(BaseModel):
+    divisions: list[Division]
 
-class Franchise(BaseModel, extra=Extra.forbid):
+
+class Franchise(BaseModel):
     """
     Class representing a National Hockey League franchise.
     Note that franchise is not the same as a team. This distinction is
@@ -186,22 +477,23 @@ class Franchise(BaseModel, extra=Extra.forbid):
     ================
     https://statsapi.web.nhl.com/api/v1/franchises
     """
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     id: int = Field(..., alias="franchiseId")
     team_name: str = Field(..., alias="teamName")
     location: str = Field(..., alias="locationName")
     most_recent_team_id: int = Field(..., alias="mostRecentTeamId")
     first_season_id: int = Field(..., alias="firstSeasonId")
     last_season_id: int | None = Field(None, alias="lastSeasonId")
-    link: str
+    link: ApiLink
 
-    possible_expands: ClassVar[list[str]] = []
+    possible_expands: ClassVar[tuple[str, ...]] = ()
 
     _fetched: ClassVar[bool] = False
     franchises_by_id: ClassVar[dict[int, Franchise]] = {}
-
-    @validator("link")
-    def prepend_base_url(cls, link: str) -> str:
-        return API_BASE_URL+link
+    # keyed by team_name and location normalized with clean_str
+    franchises_by_name_key: ClassVar[dict[bytes, Franchise]] = {}
+    franchises_by_location_key: ClassVar[dict[bytes, list[Franchise]]] = {}
 
     def __str__(self) -> str:
         return f"{self.location} {self.team_name}"
@@ -214,16 +506,28 @@ class Franchise(BaseModel, extra=Extra.forbid):
         cached so subsequent calls to methods in Franchise do not trigger
         network requests.
         """
-        if cls._fetched:
-            return list(cls.franchises_by_id.values())
+        if not cls._fetched:
+            cls._load(_get("/api/v1/franchises"))
+        return list(cls.franchises_by_id.values())
 
-        resp = httpx.get(f"{API_BASE_URL}/api/v1/franchises")
-        resp_dict = resp.json()
-        for franchise_json in resp_dict["franchises"]:
-            franchise = Franchise.parse_obj(franchise_json)
+    @classmethod
+    def _load(cls, content: bytes) -> None:
+        """
+        Parse a response from the /franchises end point and cache the results.
+        """
+        if cls._fetched:
+            return
+        franchises = _FranchisesResponse.model_validate_json(content).franchises
+        for franchise in franchises:
             cls.franchises_by_id[franchise.id] = franchise
+            # several franchises can share a name, the first one wins
+            cls.franchises_by_name_key.setdefault(
+                clean_str(franchise.team_name), franchise
+            )
+            cls.franchises_by_location_key.setdefault(
+                clean_str(franchise.location), []
+            ).append(franchise)
         Franchise._fetched = True
-        return list(cls.franchises_by_id.values())
 
     @classmethod
     def by_id(cls, id: int) -> Franchise:
@@ -247,10 +551,12 @@ class Franchise(BaseModel, extra=Extra.forbid):
         =======
         habs = Franchise.by_name("canadiens")
         """
-        for fr in cls.all():
-            if string_equal(fr.team_name, name):
-                return fr
-        raise NotFoundException(f"No franchise with {name=}")
+        if not cls._fetched:
+            cls.all()
+        try:
+            return cls.franchises_by_name_key[clean_str(name)]
+        except KeyError:
+            raise NotFoundException(f"No franchise with {name=}")
 
     @classmethod
     def by_location(cls, location: str) -> list[Franchise]:
@@ -260,10 +566,16 @@ class Franchise(BaseModel, extra=Extra.forbid):
         Example:
         montreal_teams = Franchise.by_location("montreal")
         """
-        return [fr for fr in cls.all() if string_equal(fr.location, location)]
+        if not cls._fetched:
+            cls.all()
+        return list(cls.franchises_by_location_key.get(clean_str(location), ()))
+
+
+class _FranchisesResponse(BaseModel):
+    franchises: list[Franchise]
 
 
-class Team(BaseModel, extra=Extra.forbid):
+class Team(BaseModel):
     """
     Class representing a National Hockey League team.
     Teams exist for multiple seasons but when a relocation happens they get a
@@ -279,6 +591,8 @@ class Team(BaseModel, extra=Extra.forbid):
     https://statsapi.web.nhl.com/api/v1/teams/1
     https://statsapi.web.nhl.com/api/v1/teams/1?expand=team.stats,team.roster,team.division,team.conference,team.franchise,team.schedule.previous,team.schedule.next,team.ticket,team.content.home.all,team.content.sections,team.record,team.playoffs,team.name,team.social,team.deviceProperties
     """
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     id: int
     name: str
     abbreviation: str
@@ -287,29 +601,16 @@ class Team(BaseModel, extra=Extra.forbid):
     location: str = Field(..., alias="locationName")
     franchise_id: int = Field(..., alias="franchiseId")
     active: bool
-    link: str
+    link: ApiLink
     first_year_of_play: str = Field("unknown", alias="firstYearOfPlay")
-    venue: dict | None  # FIXME: implement Venue model
-    division: Division | None
-    conference: Conference | None
-    franchise: Franchise | None
+    venue: Any = None  # FIXME: implement Venue model
+    division: Division | None = None
+    conference: Conference | None = None
+    franchise: Franchise | None = None
     official_site_url: str | None = Field(None, alias="officialSiteUrl")
 
-    # these get added when using certain expands
-    # FIXME: implement models for most of these
-    team_stats: dict | None = Field(None, alias="teamStats")
-    roster: dict | None = None
-    next_game_schedule: dict | None = Field(None, alias="nextGameSchedule")
-    previous_game_schedule: dict | None = Field(None, alias="previousGameSchedule")
-    content: dict | None = None
-    device_properties: dict | None = Field(None, alias="deviceProperties")
-    social: dict | None = None
-    record: dict | None = None
-    playoff_info: dict | None = Field(None, alias="playoffInfo")
-    tickets: dict | None = None
-    other_names: dict | None = Field(None, alias="otherNames")
-
-    possible_expands: ClassVar[list[str]] = [
+    # Teams requested with expands are parsed as ExpandedTeam instead
+    possible_expands: ClassVar[tuple[str, ...]] = (
         # Adds team_stats
         "team.stats",
         # Adds roster
@@ -341,35 +642,93 @@ class Team(BaseModel, extra=Extra.forbid):
         "team.social",
         # Adds device_properties (likely not very useful, I think this is made for a mobile app of some sort)
         "team.deviceProperties",
-    ]
-
-    @validator("link")
-    def prepend_base_url(cls, link: str) -> str:
-        return API_BASE_URL+link
-
-    @validator("conference", pre=True)
-    def discard_null_conference(cls, value: Any) -> Any:
-        return none_if_link_null(value)
+    )
+
+    # Like franchises, conferences and divisions are shared between teams
+    # rather than each Team having their own copies. The cached versions are
+    # never missing data compared to the ones included in /teams responses.
+    # Validation only looks at what is already cached (see _get_teams), the
+    # inactive ones are simply parsed from the response.
+    @field_validator("conference", mode="before")
+    @classmethod
+    def use_cached_conference(cls, value: Any) -> Any:
+        return cached_if_found(
+            none_if_link_null(value), Conference.conferences_by_id
+        )
 
-    @validator("division", pre=True)
-    def discard_null_division(cls, value: Any) -> Any:
-        return none_if_link_null(value)
+    @field_validator("division", mode="before")
+    @classmethod
+    def use_cached_division(cls, value: Any) -> Any:
+        return cached_if_found(none_if_link_null(value), Division.divisions_by_id)
 
+    @field_validator("franchise", mode="before")
     @classmethod
-    def from_obj(cls, obj: dict[str, Any]):
-        # obj["franchise"] is always present in responses from the /teams end
+    def use_cached_franchise(cls, value: Any, info: ValidationInfo) -> Franchise | None:
+        # "franchise" is always present in responses from the /teams end
         # point but it's missing some data unless ?expand=team.franchise was
-        # specified, so we overwrite the field with data directly from
+        # specified, so we replace the value with data directly from
         # the Franchise class. Doing it this way also allows us to re-use the
         # same Franchise objects rather than creating a new one each time a
         # Team object is parsed.
-        del obj["franchise"]
-        team = cls.parse_obj(obj)
-        team.franchise = Franchise.by_id(team.franchise_id)
-        return team
+        franchise_id = info.data.get("franchise_id")
+        if franchise_id is None:
+            return None
+        return Franchise.by_id(franchise_id)
+
+    @staticmethod
+    def _unfetched_lookups() -> list[tuple[Any, str]]:
+        """
+        Classes (with their end points) that validating a Team looks up objects
+        from by id but which have not been fetched yet.
+        """
+        lookups = [
+            (Franchise, "/api/v1/franchises"),
+            (Conference, "/api/v1/conferences"),
+            (Division, "/api/v1/divisions"),
+        ]
+        return [(model, path) for model, path in lookups if not model._fetched]
+
+    @classmethod
+    def _get_teams(cls, params: dict[str, Any]) -> bytes:
+        """
+        Request /teams with the given params. Any franchises, conferences or
+        divisions that have not been fetched yet are requested concurrently
+        so that they are cached before the teams get validated.
+        """
+        lookups = cls._unfetched_lookups()
+        content, *lookup_contents = _get_many(
+            [("/api/v1/teams", params), *((path, None) for _, path in lookups)]
+        )
+        for (model, _), lookup_content in zip(lookups, lookup_contents):
+            model._load(lookup_content)
+        return content
+
+    @classmethod
+    def _parse_teams(cls, content: bytes, expands: Sequence[str]) -> list[Team]:
+        # fields added by expands are only declared in ExpandedTeam
+        if expands or issubclass(cls, ExpandedTeam):
+            return _ExpandedTeamsResponse.model_validate_json(content).teams
+        return _TeamsResponse.model_validate_json(content).teams
+
+    @classmethod
+    def from_obj(cls, obj: dict[str, Any]) -> Team:
+        """
+        Parse a team from a dict as found in responses from the /teams end
+        point, the dict itself is left as it is. Use ExpandedTeam.from_obj for
+        teams requested with expands.
+
+        Examples:
+        ========
+        oilers = Team.from_obj(get_json("/api/v1/teams/22")["teams"][0])
+        """
+        lookups = cls._unfetched_lookups()
+        lookup_contents = _get_many([(path, None) for _, path in lookups])
+        for (model, _), lookup_content in zip(lookups, lookup_contents):
+            model._load(lookup_content)
+        return cls.model_validate(obj)
 
     @classmethod
-    def all(cls, expands: list[str] = []) -> list[Team]:
+    def all(cls, expands: Sequence[str] = ()) -> list[Team]:
         """
         Return a list of all teams that are currently active
 
@@ -377,15 +736,32 @@ class Team(BaseModel, extra=Extra.forbid):
         ========
         currently_active_teams = Team.all()
         """
-        resp = httpx.get(
-            f"{API_BASE_URL}/api/v1/teams",
-            params={"expand": expands}
-        )
-        resp_dict = resp.json()
-        return [cls.from_obj(team_dict) for team_dict in resp_dict["teams"]]
+        content = cls._get_teams(_expand_params(expands))
+        return cls._parse_teams(content, expands)
 
     @classmethod
-    def by_id(cls, id: int, expands: list[str] = []) -> Team:
+    async def all_async(cls, expands: Sequence[str] = ()) -> list[Team]:
+        """
+        Same as Team.all but for use in code that is already running in an
+        event loop. If the franchises, conferences or divisions have not been
+        fetched yet they are requested concurrently with the teams.
+
+        Examples:
+        ========
+        currently_active_teams = await Team.all_async()
+        """
+        lookups = cls._unfetched_lookups()
+        async with _async_client() as client:
+            content, *lookup_contents = await asyncio.gather(
+                _aget(client, "/api/v1/teams", _expand_params(expands)),
+                *(_aget(client, path) for _, path in lookups),
+            )
+        for (model, _), lookup_content in zip(lookups, lookup_contents):
+            model._load(lookup_content)
+        return cls._parse_teams(content, expands)
+
+    @classmethod
+    def by_id(cls, id: int, expands: Sequence[str] = ()) -> Team:
         """
         Find a team by its id, raises an exception if not found
 
@@ -393,16 +769,18 @@ class Team(BaseModel, extra=Extra.forbid):
         =======
         oilers = Team.by_id(22, expands=["team.stats"])
         """
-        resp = httpx.get(
-            f"{API_BASE_URL}/api/v1/teams",
-            params={"teamId": id, "expand": expands}
-        )
-        resp_dict = resp.json()
-        team = cls.from_obj(resp_dict["teams"][0])
+        try:
+            content = cls._get_teams({"teamId": id, **_expand_params(expands)})
+        except NotFoundException:
+            raise NotFoundException(f"No team with {id=}")
+        teams = cls._parse_teams(content, expands)
+        if teams == []:
+            raise NotFoundException(f"No team with {id=}")
+        team, = teams
         return team
 
     @classmethod
-    def by_season(cls, season_id: int, expands: list[str] = []) -> list[Team]:
+    def by_season(cls, season_id: int, expands: Sequence[str] = ()) -> list[Team]:
         """
         Return a list of teams active during the given season.
 
@@ -410,12 +788,56 @@ class Team(BaseModel, extra=Extra.forbid):
         ========
         teams = Team.by_season(20112012)  # Teams active during season 2011-2012
         """
-        resp = httpx.get(
-            f"{API_BASE_URL}/api/v1/teams",
-            params={"season": season_id, "expand": expands}
-        )
-        resp_dict = resp.json()
-        return [cls.from_obj(team_dict) for team_dict in resp_dict["teams"]]
+        content = cls._get_teams({"season": season_id, **_expand_params(expands)})
+        return cls._parse_teams(content, expands)
+
+
+class ExpandedTeam(Team):
+    """
+    Team with the additional fields that get added when using expands (see
+    Team.possible_expands). Methods of Team return instances of this class
+    when expands are given.
+    """
+    # The contents of these are passed through as-is (without validation)
+    # FIXME: implement models for most of these
+    team_stats: Any = Field(None, alias="teamStats")
+    roster: Any = None
+    next_game_schedule: Any = Field(None, alias="nextGameSchedule")
+    previous_game_schedule: Any = Field(None, alias="previousGameSchedule")
+    content: Any = None
+    device_properties: Any = Field(None, alias="deviceProperties")
+    social: Any = None
+    record: Any = None
+    playoff_info: Any = Field(None, alias="playoffInfo")
+    tickets: Any = None
+    other_names: Any = Field(None, alias="otherNames")
+
+
+class _TeamsResponse(BaseModel):
+    teams: list[Team]
+
+
+class _ExpandedTeamsResponse(BaseModel):
+    teams: list[ExpandedTeam]
+
+
+def clear_cache() -> None:
+    """
+    Forget all cached responses as well as the cached franchises,
+    conferences and divisions, so that they get fetched again when needed.
+    """
+    with _cache_lock:
+        _response_cache.clear()
+    Franchise._fetched = False
+    Franchise.franchises_by_id.clear()
+    Franchise.franchises_by_name_key.clear()
+    Franchise.franchises_by_location_key.clear()
+    Conference._fetched = False
+    Conference._active = []
+    Conference.conferences_by_id.clear()
+    Division._fetched = False
+    Division._active = []
+    Division.divisions_by_id.clear()
 
 
 Franchises = Franchise
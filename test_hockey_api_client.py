@@ -1,9 +1,289 @@
+import asyncio
+import json
+
+import httpx
 import pytest
 
 import hockey_api_client as nhl
 from hockey_api_client import NotFoundException
 
-# TODO: figure out some way to store api responses locally and mock the api
+# Tests using the mock_api fixture use the (abridged) responses below rather
+# than the real API. The rest of the tests require network access.
+# TODO: store more real api responses locally and mock the api everywhere
+
+CONFERENCES = [
+    {"id": 6, "name": "Eastern", "link": "/api/v1/conferences/6",
+     "abbreviation": "E", "shortName": "East", "active": True},
+    {"id": 5, "name": "Western", "link": "/api/v1/conferences/5",
+     "abbreviation": "W", "shortName": "West", "active": True},
+]
+DIVISIONS = [
+    {"id": 15, "name": "Pacific", "nameShort": "PAC", "link": "/api/v1/divisions/15",
+     "abbreviation": "P", "active": True,
+     "conference": {"id": 5, "name": "Western", "link": "/api/v1/conferences/5"}},
+    {"id": 17, "name": "Atlantic", "nameShort": "ATL", "link": "/api/v1/divisions/17",
+     "abbreviation": "A", "active": True,
+     "conference": {"id": 6, "name": "Eastern", "link": "/api/v1/conferences/6"}},
+]
+FRANCHISES = [
+    {"franchiseId": 6, "firstSeasonId": 19241925, "mostRecentTeamId": 6,
+     "teamName": "Bruins", "locationName": "Boston", "link": "/api/v1/franchises/6"},
+    {"franchiseId": 7, "firstSeasonId": 19241925, "lastSeasonId": 19371938,
+     "mostRecentTeamId": 43, "teamName": "Maroons", "locationName": "Montreal",
+     "link": "/api/v1/franchises/7"},
+    {"franchiseId": 25, "firstSeasonId": 19791980, "mostRecentTeamId": 22,
+     "teamName": "Oilers", "locationName": "Edmonton", "link": "/api/v1/franchises/25"},
+]
+
+
+def _team(id, name, team_name, location, franchise_id, division, conference):
+    return {
+        "id": id, "name": name, "link": f"/api/v1/teams/{id}",
+        "venue": {"name": "Arena", "link": "/api/v1/venues/null", "city": location},
+        "abbreviation": name[:3].upper(), "teamName": team_name,
+        "locationName": location, "firstYearOfPlay": "1917",
+        "division": division, "conference": conference,
+        "franchise": {"franchiseId": franchise_id, "teamName": team_name,
+                      "link": f"/api/v1/franchises/{franchise_id}"},
+        "shortName": location, "officialSiteUrl": "https://www.nhl.com/",
+        "franchiseId": franchise_id, "active": True,
+    }
+
+
+TEAMS = [
+    _team(
+        22, "Edmonton Oilers", "Oilers", "Edmonton", 25,
+        {"id": 15, "name": "Pacific", "nameShort": "PAC",
+         "link": "/api/v1/divisions/15", "abbreviation": "P"},
+        {"id": 5, "name": "Western", "link": "/api/v1/conferences/5"},
+    ),
+    _team(
+        6, "Boston Bruins", "Bruins", "Boston", 6,
+        {"id": 17, "name": "Atlantic", "nameShort": "ATL",
+         "link": "/api/v1/divisions/17", "abbreviation": "A"},
+        {"id": 6, "name": "Eastern", "link": "/api/v1/conferences/6"},
+    ),
+]
+TEAMS_19371938 = [
+    _team(
+        43, "Montreal Maroons", "Maroons", "Montreal", 7,
+        {"id": 1, "name": "Canadian", "link": "/api/v1/divisions/1"},
+        {"id": 1, "name": "Original", "link": "/api/v1/conferences/1"},
+    ),
+]
+
+
+def _teams_response(request):
+    params = request.url.params
+    teams = TEAMS_19371938 if params.get("season") == "19371938" else TEAMS
+    if "teamId" in params:
+        teams = [team for team in teams if str(team["id"]) == params["teamId"]]
+    expands = params.get("expand", "").split(",")
+    if "team.roster" in expands:
+        teams = [{**team, "roster": {"roster": []}} for team in teams]
+    if "team.stats" in expands:
+        teams = [{**team, "teamStats": [{"splits": []}]} for team in teams]
+    return httpx.Response(200, json={"teams": teams})
+
+
+class MockAPI:
+    def __init__(self):
+        self.requests = []
+        self.routes = {
+            "/api/v1/conferences": lambda request: httpx.Response(
+                200, json={"conferences": CONFERENCES}
+            ),
+            "/api/v1/divisions": lambda request: httpx.Response(
+                200, json={"divisions": DIVISIONS}
+            ),
+            "/api/v1/franchises": lambda request: httpx.Response(
+                200, json={"franchises": FRANCHISES}
+            ),
+            "/api/v1/teams": _teams_response,
+        }
+        self.transport = httpx.MockTransport(self.handle)
+
+    def handle(self, request):
+        self.requests.append(request)
+        route = self.routes.get(request.url.path)
+        if route is None:
+            return httpx.Response(
+                404, json={"messageNumber": 10, "message": "Object not found"}
+            )
+        return route(request)
+
+    def paths(self):
+        return [request.url.path for request in self.requests]
+
+
+@pytest.fixture
+def mock_api(monkeypatch):
+    api = MockAPI()
+    client = httpx.Client(base_url=nhl.API_BASE_URL, transport=api.transport)
+    monkeypatch.setattr(nhl, "_CLIENT", client)
+    monkeypatch.setattr(nhl, "_async_client", lambda: httpx.AsyncClient(
+        base_url=nhl.API_BASE_URL, transport=api.transport
+    ))
+    nhl.clear_cache()
+    yield api
+    nhl.clear_cache()
+    client.close()
+
+
+def test_cache_hit(mock_api):
+    first = nhl.get_json("/api/v1/conferences")
+    second = nhl.get_json("/api/v1/conferences")
+    assert first == second
+    assert mock_api.paths() == ["/api/v1/conferences"]
+
+
+def test_cache_expired(mock_api, monkeypatch):
+    monkeypatch.setattr(nhl, "CACHE_TTL", 0)
+    nhl.get_json("/api/v1/conferences")
+    nhl.get_json("/api/v1/conferences")
+    assert mock_api.paths() == ["/api/v1/conferences"] * 2
+
+
+def test_cache_evicts_oldest(mock_api, monkeypatch):
+    monkeypatch.setattr(nhl, "CACHE_MAXSIZE", 2)
+    nhl.get_json("/api/v1/conferences")
+    nhl.get_json("/api/v1/divisions")
+    nhl.get_json("/api/v1/franchises")
+    assert len(nhl._response_cache) == 2
+    nhl.get_json("/api/v1/conferences")
+    assert mock_api.paths()[-1] == "/api/v1/conferences"
+    assert len(mock_api.requests) == 4
+
+
+def test_get_json_list_params(mock_api):
+    nhl.get_json("/api/v1/teams", params={"teamId": [22, 6]})
+    nhl.get_json("/api/v1/teams", params={"teamId": [22, 6]})
+    assert mock_api.requests[0].url.params.get_list("teamId") == ["22", "6"]
+    assert len(mock_api.requests) == 1
+
+
+def test_expands_sorted_in_url(mock_api):
+    nhl.Team.by_id(22, expands=["team.stats", "team.roster"])
+    nhl.Team.by_id(22, expands=["team.roster", "team.stats"])
+    team_requests = [r for r in mock_api.requests if r.url.path == "/api/v1/teams"]
+    assert len(team_requests) == 1
+    assert team_requests[0].url.params["expand"] == "team.roster,team.stats"
+
+
+def test_expands_given_as_string(mock_api):
+    oilers = nhl.Team.by_id(22, expands="team.stats")
+    assert oilers.team_stats == [{"splits": []}]
+    nhl.Team.by_id(22, expands=["team.stats"])
+    team_requests = [r for r in mock_api.requests if r.url.path == "/api/v1/teams"]
+    assert len(team_requests) == 1
+    assert team_requests[0].url.params["expand"] == "team.stats"
+
+
+def test_error_responses_not_cached(mock_api):
+    teams_route = mock_api.routes["/api/v1/teams"]
+    mock_api.routes["/api/v1/teams"] = lambda request: httpx.Response(
+        503, json={"message": "Service Unavailable"}
+    )
+    with pytest.raises(httpx.HTTPStatusError):
+        nhl.Team.by_season(20112012)
+    with pytest.raises(httpx.HTTPStatusError):
+        nhl.Team.by_id(22)
+    mock_api.routes["/api/v1/teams"] = teams_route
+    assert len(nhl.Team.by_season(20112012)) == 2
+
+
+def test_team_by_id_not_found(mock_api):
+    with pytest.raises(NotFoundException):
+        nhl.Team.by_id(0)
+    mock_api.routes["/api/v1/teams"] = lambda request: httpx.Response(
+        404, json={"messageNumber": 10, "message": "Object not found"}
+    )
+    with pytest.raises(NotFoundException):
+        nhl.Team.by_id(9001)
+
+
+def test_clear_cache(mock_api):
+    nhl.Franchise.by_id(6)
+    nhl.clear_cache()
+    nhl.Franchise.by_id(6)
+    assert mock_api.paths() == ["/api/v1/franchises"] * 2
+
+
+def test_conferences_and_divisions_all_cached(mock_api):
+    conferences = nhl.Conference.all()
+    assert nhl.Conference.all() == conferences
+    assert all(a is b for a, b in zip(nhl.Conference.all(), conferences))
+    assert nhl.Conference.by_id(5) is conferences[1]
+    divisions = nhl.Division.all()
+    assert all(a is b for a, b in zip(nhl.Division.all(), divisions))
+    assert nhl.Division.by_id(15) is divisions[0]
+    assert mock_api.paths() == ["/api/v1/conferences", "/api/v1/divisions"]
+
+
+def test_team_divisions_not_duplicated(mock_api):
+    teams = nhl.Team.all()
+    assert teams[0].division is nhl.Division.by_id(teams[0].division.id)
+    assert teams[0].conference is nhl.Conference.by_id(teams[0].conference.id)
+
+
+def test_team_inactive_division_not_fetched(mock_api):
+    maroons, = nhl.Team.by_season(19371938)
+    assert maroons.division.name == "Canadian"
+    assert maroons.conference.name == "Original"
+    assert all("divisionId" not in r.url.params for r in mock_api.requests)
+    assert all("conferenceId" not in r.url.params for r in mock_api.requests)
+
+
+def test_team_all_fetches_lookups_once(mock_api):
+    teams = nhl.Team.all()
+    assert [team.name for team in teams] == ["Edmonton Oilers", "Boston Bruins"]
+    assert sorted(mock_api.paths()) == [
+        "/api/v1/conferences", "/api/v1/divisions",
+        "/api/v1/franchises", "/api/v1/teams",
+    ]
+    nhl.Team.by_season(20112012)
+    assert len(mock_api.requests) == 5
+
+
+def test_team_all_async(mock_api):
+    teams = asyncio.run(nhl.Team.all_async())
+    assert teams[0].division is nhl.Division.by_id(15)
+    assert teams[0].franchise is nhl.Franchise.by_id(25)
+    assert len(mock_api.requests) == 4
+
+
+def test_team_from_obj(mock_api):
+    obj = nhl.get_json("/api/v1/teams", params={"teamId": 22})["teams"][0]
+    oilers = nhl.Team.from_obj(obj)
+    assert "franchise" in obj
+    assert oilers.franchise is nhl.Franchise.by_id(25)
+    assert oilers.division is nhl.Division.by_id(15)
+
+
+def test_team_expands_return_expanded_team(mock_api):
+    oilers = nhl.Team.by_id(22, expands=["team.roster", "team.stats"])
+    assert isinstance(oilers, nhl.ExpandedTeam)
+    assert oilers.roster == {"roster": []}
+    assert oilers.team_stats == [{"splits": []}]
+    oilers = nhl.Team.by_id(22)
+    assert type(oilers) is nhl.Team
+    assert not hasattr(oilers, "roster")
+    assert all(isinstance(team, nhl.ExpandedTeam) for team in nhl.ExpandedTeam.all())
+
+
+def test_get_json(mock_api, monkeypatch):
+    assert nhl.get_json("/api/v1/conferences") == {"conferences": CONFERENCES}
+    # same result whether or not orjson is installed
+    monkeypatch.setattr(nhl, "_loads", json.loads)
+    assert nhl.get_json("/api/v1/conferences") == {"conferences": CONFERENCES}
+    with pytest.raises(NotFoundException):
+        nhl.get_json("/api/v1/no-such-end-point")
+
+
+def test_string_equal():
+    assert nhl.string_equal("Montréal", "MONTREAL")
+    assert nhl.string_equal("Œuvre", "oeuvre")
+    assert not nhl.string_equal("Montréal", "Montreal Maroons")
 
 
 def test_conferences_all():